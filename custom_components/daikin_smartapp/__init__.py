@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -24,6 +25,8 @@ from .coordinator import DaikinCoordinator
 DaikinConfigEntry = ConfigEntry[dict[str, Any]]
 _LOGGER = logging.getLogger(__name__)
 
+_LEGACY_POWER_BUTTON_SUFFIXES: tuple[str, ...] = ("_power_on_i", "_power_off_o")
+
 
 async def _async_cleanup_legacy_power_buttons(
     hass: HomeAssistant, entry: DaikinConfigEntry
@@ -35,16 +38,25 @@ async def _async_cleanup_legacy_power_buttons(
         for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
         if ent.domain == "button"
         and ent.unique_id
-        and (
-            ent.unique_id.endswith("_power_on_i")
-            or ent.unique_id.endswith("_power_off_o")
-        )
+        and ent.unique_id.endswith(_LEGACY_POWER_BUTTON_SUFFIXES)
     ]
+    # The registry schedules a delayed save on each removal, so back-to-back
+    # removals here are already coalesced into a single storage write.
     for ent in stale_entities:
         _LOGGER.debug("Removing legacy entity %s (%s)", ent.entity_id, ent.unique_id)
         ent_reg.async_remove(ent.entity_id)
 
 
+async def _async_safe_cleanup_legacy_power_buttons(
+    hass: HomeAssistant, entry: DaikinConfigEntry
+) -> None:
+    """Run legacy cleanup without letting registry glitches fail setup."""
+    try:
+        await _async_cleanup_legacy_power_buttons(hass, entry)
+    except Exception:
+        _LOGGER.exception("Failed to remove legacy Daikin power button entities")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: DaikinConfigEntry) -> bool:
     """Set up Daikin SmartApp from config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -59,8 +71,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: DaikinConfigEntry) -> bo
         auth_mode=entry.data.get(CONF_AUTH_MODE, "id_token"),
     )
     coordinator = DaikinCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
-    await _async_cleanup_legacy_power_buttons(hass, entry)
+    # Legacy cleanup only touches the entity registry, so it can overlap the
+    # first network refresh.
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        _async_safe_cleanup_legacy_power_buttons(hass, entry),
+    )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import re
-from typing import Any
-from urllib.parse import urljoin
+import string
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from aiohttp import ClientSession
+import orjson
 
 from .const import (
     API_BASE_URL,
@@ -22,11 +26,71 @@ from .const import (
     MULTIREQ_PATH,
     POWER_OFF,
     POWER_ON,
+    extract_fan_speed_code,
+    fan_speed_param_key_for_mode,
 )
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_CLIENT_ID_RE = re.compile(r"client[_-]?id['\"\s:=]+([A-Za-z0-9._-]{8,})", re.IGNORECASE)
+_CLIENT_SECRET_RE = re.compile(
+    r"client[_-]?secret['\"\s:=]+([A-Za-z0-9._-]{16,})", re.IGNORECASE
+)
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+_EDGE_PREFIX = "/dsiot/edges/"
+_EDGE_PREFIX_LEN = len(_EDGE_PREFIX)
+
+# Flattened raw_status keys ("<group>.<param>") decoded on every refresh.
+_K_MODE = "e_3001.p_01"
+_K_TARGET_TEMP = "e_3001.p_02"
+_K_FAN = "e_3003.p_2D"
+_K_POWER = "e_A002.p_01"
+_K_ROOM_TEMP = "e_A00B.p_01"
+_K_ROOM_HUMIDITY = "e_A00B.p_02"
+_K_SENSOR_TEMP_1 = "e_A00B.p_05"
+_K_SENSOR_TEMP_2 = "e_A00B.p_06"
+
+# Bound in-flight requests so status chunks don't monopolise HA's shared connector.
+_MAX_CONCURRENT_REQUESTS = 4
+_REQUEST_TIMEOUT = 30
+_STATUS_CHUNK_SIZE = 8
+_STATUS_PAYLOAD_CACHE_SIZE = 16
+
+# Default e_3001 parameters written alongside each operation mode.
+_MODE_TEMPLATES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        MODE_CODE_COOL: MappingProxyType(
+            {
+                "p_02": "32",
+                "p_05": "0F0000",
+                "p_06": "0F0000",
+                "p_09": "0700",
+                "p_0C": "00",
+            }
+        ),
+        MODE_CODE_DRY: MappingProxyType(
+            {
+                "p_22": "020000",
+                "p_23": "0F0000",
+                "p_27": "0A00",
+                "p_31": "00",
+            }
+        ),
+        # Fan-only appears to require its own e_3001 parameter group.
+        MODE_CODE_FAN: MappingProxyType(
+            {
+                "p_24": "020000",
+                "p_25": "050000",
+                "p_28": "0A00",
+            }
+        ),
+    }
+)
+_EMPTY_MODE_TEMPLATE: Mapping[str, str] = MappingProxyType({})
+
 
 class DaikinAuthError(Exception):
     """Raised when auth fails."""
@@ -46,12 +110,14 @@ class DaikinUnit:
     power_code: str | None
     mode_code: str | None
     fan_code: str | None
+    fan_speed_code: str | None
     target_temp_c: float | None
     room_temp_c: float | None
     room_humidity_percent: int | None
     sensor_temp_1_c: float | None
     sensor_temp_2_c: float | None
     raw_status: dict[str, str]
+    snapshot_attrs: dict[str, Any]
 
 
 def _child_by_pn(node: dict[str, Any], pn: str) -> dict[str, Any] | None:
@@ -61,19 +127,16 @@ def _child_by_pn(node: dict[str, Any], pn: str) -> dict[str, Any] | None:
     return None
 
 
-def _children_to_map(node: dict[str, Any]) -> dict[str, str]:
-    out: dict[str, str] = {}
-    for child in node.get("pch", []):
-        if not isinstance(child, dict):
-            continue
-        key = child.get("pn")
-        if not key:
-            continue
-        if "pv" in child:
-            out[str(key)] = str(child.get("pv"))
-    return out
+def _child_pv(node: dict[str, Any] | None, pn: str) -> str:
+    if not node:
+        return ""
+    child = _child_by_pn(node, pn)
+    if not child:
+        return ""
+    return str(child.get("pv") or "")
 
 
+@lru_cache(maxsize=256)
 def _decode_hex_int(value: str | None) -> int | None:
     if not value:
         return None
@@ -83,6 +146,7 @@ def _decode_hex_int(value: str | None) -> int | None:
         return None
 
 
+@lru_cache(maxsize=256)
 def _decode_hex_signed_byte(value: str | None) -> int | None:
     n = _decode_hex_int(value)
     if n is None:
@@ -92,23 +156,28 @@ def _decode_hex_signed_byte(value: str | None) -> int | None:
     return n
 
 
+@lru_cache(maxsize=256)
 def _decode_hex_half_degree(value: str | None) -> float | None:
     n = _decode_hex_int(value)
     if n is None:
         return None
-    return round(n / 2.0, 1)
+    return round(n * 0.5, 1)
 
 
+@lru_cache(maxsize=256)
 def _decode_hex_le_i16_half_degree(value: str | None) -> float | None:
     """Decode little-endian signed 16-bit value as half-degree Celsius."""
-    if not value or len(value) != 4:
+    # int(..., 16) also accepts signs, "0x", "_" and whitespace; only allow hex digits.
+    if not value or len(value) != 4 or not _HEX_DIGITS.issuperset(value):
         return None
     try:
-        raw = bytes.fromhex(value)
-    except ValueError:
+        raw = int(value, 16)
+    except (ValueError, TypeError):
         return None
-    n = int.from_bytes(raw, byteorder="little", signed=True)
-    return round(n / 2.0, 1)
+    n = ((raw & 0xFF) << 8) | (raw >> 8)
+    if n & 0x8000:
+        n -= 0x10000
+    return round(n * 0.5, 1)
 
 
 class DaikinApiClient:
@@ -132,11 +201,22 @@ class DaikinApiClient:
         self._client_secret = client_secret
         self._client_uuid = client_uuid
         self._auth_mode = auth_mode
-        self._base_url = base_url.rstrip("/")
+        self._base_url = base_url.rstrip("/") + "/"
         self._access_token: str | None = None
         self._id_token: str | None = None
         self._refresh_token: str | None = None
+        # Ordered (auth_mode, token) pairs; reset whenever tokens or auth mode change.
+        self._token_candidates_cache: tuple[tuple[str, str], ...] | None = None
         self._units: dict[str, DaikinUnit] = {}
+        self._status_payload_cache: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        self._request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        # Serializes re-login so concurrent status chunks don't race on tokens.
+        self._login_lock = asyncio.Lock()
+        self._base_headers: dict[str, str] = {
+            "accept": "*/*",
+            "content-type": "application/json",
+            "user-agent": "DaikinMobileController/2.0.0 CFNetwork/3860.100.1 Darwin/25.0.0",
+        }
 
     @property
     def units(self) -> dict[str, DaikinUnit]:
@@ -159,16 +239,18 @@ class DaikinApiClient:
         while queue:
             node = queue.pop()
             if isinstance(node, dict):
-                lowered = {str(k).lower(): v for k, v in node.items()}
-                cid = lowered.get("client_id") or lowered.get("clientid")
-                csec = lowered.get("client_secret") or lowered.get("clientsecret")
+                cid: Any = None
+                csec: Any = None
+                for k, v in node.items():
+                    key = k.lower() if isinstance(k, str) else str(k).lower()
+                    if key in id_keys:
+                        cid = cid or v
+                    elif key in secret_keys:
+                        csec = csec or v
+                    elif isinstance(v, (dict, list)):
+                        queue.append(v)
                 if isinstance(cid, str) and isinstance(csec, str) and cid and csec:
                     return cid.strip(), csec.strip()
-                for k, v in lowered.items():
-                    if k in id_keys | secret_keys:
-                        continue
-                    if isinstance(v, (dict, list)):
-                        queue.append(v)
             elif isinstance(node, list):
                 queue.extend(node)
         return None
@@ -177,12 +259,8 @@ class DaikinApiClient:
     def _extract_client_credentials_from_text(text: str) -> tuple[str, str] | None:
         if not text:
             return None
-        id_match = re.search(r"client[_-]?id['\"\\s:=]+([A-Za-z0-9._-]{8,})", text, re.IGNORECASE)
-        sec_match = re.search(
-            r"client[_-]?secret['\"\\s:=]+([A-Za-z0-9._-]{16,})",
-            text,
-            re.IGNORECASE,
-        )
+        id_match = _CLIENT_ID_RE.search(text)
+        sec_match = _CLIENT_SECRET_RE.search(text)
         if not id_match or not sec_match:
             return None
         return id_match.group(1), sec_match.group(1)
@@ -198,33 +276,52 @@ class DaikinApiClient:
             {"user_id": self._username, "password": self._password},
             {"username": self._username, "password": self._password},
         ]
+        last_err: Exception | None = None
+        got_response = False
         for url in API_CREDENTIAL_DISCOVERY_URLS:
-            for payload in payload_variants:
-                status, data, text = await self._request(
-                    "POST", url, json_body=payload, auth=False
-                )
+            # Variants are independent one-off bootstrap calls; send them together
+            # and take the first (in preference order) that yields credentials.
+            results = await asyncio.gather(
+                *(
+                    self._request("POST", url, json_body=payload, auth=False)
+                    for payload in payload_variants
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    last_err = result
+                    continue
+                got_response = True
+                status, data, text = result
                 if isinstance(data, dict):
                     resolved = self._extract_client_credentials(data)
                     if resolved:
                         self._client_id, self._client_secret = resolved
                         _LOGGER.debug("Resolved client credentials from %s", url)
                         return resolved
+                # Some endpoints return non-200 with useful JSON/text payloads,
+                # so the text scan runs regardless of status.
                 resolved = self._extract_client_credentials_from_text(text)
                 if resolved:
                     self._client_id, self._client_secret = resolved
-                    _LOGGER.debug("Resolved client credentials from %s text payload", url)
+                    _LOGGER.debug(
+                        "Resolved client credentials from %s text payload (HTTP %s)",
+                        url,
+                        status,
+                    )
                     return resolved
-                # Some endpoints return non-200 with useful JSON/text payloads.
-                if status in (400, 401, 403) and text:
-                    resolved = self._extract_client_credentials_from_text(text)
-                    if resolved:
-                        self._client_id, self._client_secret = resolved
-                        _LOGGER.debug("Resolved client credentials from %s error payload", url)
-                        return resolved
 
+        if last_err is not None and not got_response:
+            # Nothing reached the server; surface the transport error as before.
+            raise last_err
         raise DaikinAuthError("Could not resolve app client credentials from server.")
 
-    def _token_candidates(self) -> list[tuple[str, str]]:
+    def _token_candidates(self) -> tuple[tuple[str, str], ...]:
+        if self._token_candidates_cache is not None:
+            return self._token_candidates_cache
         candidates: list[tuple[str, str]] = []
         if self._auth_mode == AUTH_MODE_ACCESS_TOKEN:
             if self._access_token:
@@ -236,7 +333,8 @@ class DaikinApiClient:
                 candidates.append((AUTH_MODE_ID_TOKEN, self._id_token))
             if self._access_token:
                 candidates.append((AUTH_MODE_ACCESS_TOKEN, self._access_token))
-        return candidates
+        self._token_candidates_cache = tuple(candidates)
+        return self._token_candidates_cache
 
     async def _request(
         self,
@@ -247,12 +345,11 @@ class DaikinApiClient:
         auth: bool = True,
         extra_headers: dict[str, str] | None = None,
     ) -> tuple[int, Any, str]:
-        url = urljoin(f"{self._base_url}/", path.lstrip("/"))
-        headers = {
-            "accept": "*/*",
-            "content-type": "application/json",
-            "user-agent": "DaikinMobileController/2.0.0 CFNetwork/3860.100.1 Darwin/25.0.0",
-        }
+        if path.startswith(("https://", "http://")):
+            url = path
+        else:
+            url = self._base_url + path.lstrip("/")
+        headers = self._base_headers.copy()
         if auth:
             candidates = self._token_candidates()
             if not candidates:
@@ -261,15 +358,25 @@ class DaikinApiClient:
         if extra_headers:
             headers.update(extra_headers)
 
-        async with self._session.request(
-            method, url, headers=headers, json=json_body
-        ) as resp:
-            text = await resp.text()
-            try:
-                data = await resp.json(content_type=None)
-            except Exception:
-                data = None
-            return resp.status, data, text
+        # Serialize ourselves; content-type is already set in the base headers.
+        body = orjson.dumps(json_body) if json_body is not None else None
+        # Daikin endpoints never redirect; a stuck request must not hang the coordinator.
+        async with self._request_semaphore:
+            async with asyncio.timeout(_REQUEST_TIMEOUT), self._session.request(
+                method,
+                url,
+                headers=headers,
+                data=body,
+                allow_redirects=False,
+                raise_for_status=False,
+            ) as resp:
+                # Read the body once; aiohttp's text()/json() would decode it twice.
+                text = (await resp.read()).decode("utf-8", "replace")
+                try:
+                    data = orjson.loads(text) if text else None
+                except ValueError:
+                    data = None
+                return resp.status, data, text
 
     async def async_login(self) -> None:
         await self.async_resolve_client_credentials()
@@ -293,52 +400,63 @@ class DaikinApiClient:
         self._access_token = data.get("access_token")
         self._id_token = data.get("id_token")
         self._refresh_token = data.get("refresh_token")
+        self._token_candidates_cache = None
         if not self._access_token and not self._id_token:
             raise DaikinAuthError("Login succeeded but no token fields were returned.")
 
     async def _ensure_auth(self) -> None:
         if not self._id_token and not self._access_token:
+            await self._async_relogin((None, None))
+
+    async def _async_relogin(self, stale_tokens: tuple[str | None, str | None]) -> None:
+        """Log in again unless a concurrent request already replaced stale_tokens."""
+        async with self._login_lock:
+            if (self._access_token, self._id_token) != stale_tokens:
+                return
             await self.async_login()
 
     async def _multireq(self, method: str, requests_payload: list[dict[str, Any]]) -> Any:
         await self._ensure_auth()
         last_status = 0
         last_text = ""
+        body = {"requests": requests_payload}
+        tokens = (self._access_token, self._id_token)
+        candidates = self._token_candidates()
         for attempt in range(2):
-            for mode, token in self._token_candidates():
+            for mode, token in candidates:
                 status, data, text = await self._request(
                     method,
                     MULTIREQ_PATH,
-                    json_body={"requests": requests_payload},
+                    json_body=body,
                     auth=False,
                     extra_headers={"authorization": f"Bearer {token}"},
                 )
                 last_status, last_text = status, text
                 if status == 200 and isinstance(data, dict):
                     # Lock onto whichever token type works.
-                    self._auth_mode = mode
+                    if self._auth_mode != mode:
+                        self._auth_mode = mode
+                        self._token_candidates_cache = None
                     _LOGGER.debug("Daikin multireq authorized via %s", mode)
                     return data
+            if attempt:
+                break
             # Refresh login and retry both token types once.
-            await self.async_login()
+            await self._async_relogin(tokens)
+            tokens = (self._access_token, self._id_token)
+            candidates = self._token_candidates()
         raise DaikinApiError(
             f"multireq failed after token fallback: HTTP {last_status} body={last_text[:300]}"
         )
 
     def _merge_unit_edge(self, units: dict[str, DaikinUnit], edge: dict[str, Any], edge_id: str) -> None:
-        name = ""
-        mac = ""
-        for node in edge.get("pch", []):
-            if not isinstance(node, dict):
-                continue
-            if node.get("pn") == "adp_d":
-                for child in node.get("pch", []):
-                    if isinstance(child, dict) and child.get("pn") == "name":
-                        name = str(child.get("pv") or "")
-            elif node.get("pn") == "adp_i":
-                for child in node.get("pch", []):
-                    if isinstance(child, dict) and child.get("pn") == "mac":
-                        mac = str(child.get("pv") or "")
+        top = {
+            node.get("pn"): node
+            for node in edge.get("pch", ())
+            if isinstance(node, dict) and node.get("pn")
+        }
+        name = _child_pv(top.get("adp_d"), "name")
+        mac = _child_pv(top.get("adp_i"), "mac")
 
         existing = units.get(edge_id)
         if existing:
@@ -354,12 +472,14 @@ class DaikinApiClient:
             power_code=None,
             mode_code=None,
             fan_code=None,
+            fan_speed_code=None,
             target_temp_c=None,
             room_temp_c=None,
             room_humidity_percent=None,
             sensor_temp_1_c=None,
             sensor_temp_2_c=None,
             raw_status={},
+            snapshot_attrs={},
         )
 
     async def async_fetch_units(self) -> dict[str, DaikinUnit]:
@@ -392,31 +512,36 @@ class DaikinApiClient:
                 continue
 
             # Fallback: merge per-edge response fragments.
-            if fr.startswith("/dsiot/edges/"):
-                parts = fr.split("/")
-                if len(parts) >= 4 and parts[3].isdigit() and isinstance(pc, dict):
-                    edge_id = parts[3]
+            if fr.startswith(_EDGE_PREFIX) and isinstance(pc, dict):
+                edge_id = fr[_EDGE_PREFIX_LEN:].partition("/")[0]
+                if edge_id.isdigit():
                     self._merge_unit_edge(units, {"pch": [pc]}, edge_id)
         _LOGGER.debug("Daikin discovery found %s units", len(units))
         return units
 
     async def async_fetch_status(self, edge_ids: list[str]) -> dict[str, dict[str, str]]:
-        requests_payload = [
-            {"op": 2, "to": f"/dsiot/edges/{edge_id}/adr_0100.dgc_status?filter=pv"}
-            for edge_id in edge_ids
-        ]
+        edge_key = tuple(edge_ids)
+        requests_payload = self._status_payload_cache.get(edge_key)
+        if requests_payload is None:
+            # One entry per status chunk; edge sets rarely change, so just reset
+            # the cache if it ever outgrows the expected number of chunks.
+            if len(self._status_payload_cache) >= _STATUS_PAYLOAD_CACHE_SIZE:
+                self._status_payload_cache.clear()
+            requests_payload = self._status_payload_cache[edge_key] = [
+                {"op": 2, "to": f"/dsiot/edges/{edge_id}/adr_0100.dgc_status?filter=pv"}
+                for edge_id in edge_ids
+            ]
         data = await self._multireq("POST", requests_payload)
         out: dict[str, dict[str, str]] = {}
         for resp in data.get("responses", []):
             if not isinstance(resp, dict):
                 continue
             fr = str(resp.get("fr", ""))
-            if "/adr_0100.dgc_status" not in fr:
+            if not fr.startswith(_EDGE_PREFIX):
                 continue
-            parts = fr.split("/")
-            if len(parts) < 4:
+            edge_id, _, tail = fr[_EDGE_PREFIX_LEN:].partition("/")
+            if not edge_id or "adr_0100.dgc_status" not in tail:
                 continue
-            edge_id = parts[3]
             pc = resp.get("pc")
             if not isinstance(pc, dict):
                 continue
@@ -424,14 +549,19 @@ class DaikinApiClient:
             if not status_root:
                 continue
             merged: dict[str, str] = {}
-            for group in status_root.get("pch", []):
+            for group in status_root.get("pch", ()):
                 if not isinstance(group, dict):
                     continue
-                group_name = str(group.get("pn") or "")
+                group_name = group.get("pn")
                 if not group_name:
                     continue
-                group_map = _children_to_map(group)
-                merged.update({f"{group_name}.{k}": v for k, v in group_map.items()})
+                prefix = f"{group_name}."
+                for child in group.get("pch", ()):
+                    if not isinstance(child, dict) or "pv" not in child:
+                        continue
+                    key = child.get("pn")
+                    if key:
+                        merged[prefix + str(key)] = str(child["pv"])
             out[edge_id] = merged
         return out
 
@@ -441,19 +571,52 @@ class DaikinApiClient:
             self._units = {}
             return {}
 
-        status_map = await self.async_fetch_status(list(units))
+        edge_ids = list(units)
+        if len(edge_ids) <= _STATUS_CHUNK_SIZE:
+            status_map = await self.async_fetch_status(edge_ids)
+        else:
+            # Large accounts: overlap the round-trips of several smaller multireqs.
+            status_map = {}
+            for chunk_map in await asyncio.gather(
+                *(
+                    self.async_fetch_status(edge_ids[i : i + _STATUS_CHUNK_SIZE])
+                    for i in range(0, len(edge_ids), _STATUS_CHUNK_SIZE)
+                )
+            ):
+                status_map.update(chunk_map)
         for edge_id, unit in units.items():
             raw = status_map.get(edge_id, {})
+            get = raw.get
             unit.raw_status = raw
-            unit.mode_code = raw.get("e_3001.p_01")
-            unit.fan_code = raw.get("e_3003.p_2D")
-            unit.power_code = raw.get("e_A002.p_01")
-            unit.target_temp_c = _decode_hex_half_degree(raw.get("e_3001.p_02"))
-            room_temp = _decode_hex_signed_byte(raw.get("e_A00B.p_01"))
+            unit.mode_code = get(_K_MODE)
+            unit.fan_code = get(_K_FAN)
+            unit.power_code = get(_K_POWER)
+            unit.fan_speed_code = extract_fan_speed_code(raw, unit.mode_code)
+            unit.target_temp_c = _decode_hex_half_degree(get(_K_TARGET_TEMP))
+            room_temp = _decode_hex_signed_byte(get(_K_ROOM_TEMP))
             unit.room_temp_c = float(room_temp) if room_temp is not None else None
-            unit.room_humidity_percent = _decode_hex_int(raw.get("e_A00B.p_02"))
-            unit.sensor_temp_1_c = _decode_hex_le_i16_half_degree(raw.get("e_A00B.p_05"))
-            unit.sensor_temp_2_c = _decode_hex_le_i16_half_degree(raw.get("e_A00B.p_06"))
+            unit.room_humidity_percent = _decode_hex_int(get(_K_ROOM_HUMIDITY))
+            unit.sensor_temp_1_c = _decode_hex_le_i16_half_degree(get(_K_SENSOR_TEMP_1))
+            unit.sensor_temp_2_c = _decode_hex_le_i16_half_degree(get(_K_SENSOR_TEMP_2))
+            unit.snapshot_attrs = {
+                "edge_id": unit.edge_id,
+                "mac": unit.mac,
+                "power_code": unit.power_code,
+                "mode_code": unit.mode_code,
+                "fan_code": unit.fan_code,
+                "fan_speed_code": unit.fan_speed_code,
+                "fan_speed_param_key": fan_speed_param_key_for_mode(unit.mode_code),
+                "fan_speed_p09": get("e_3001.p_09"),
+                "fan_speed_p27": get("e_3001.p_27"),
+                "fan_speed_p28": get("e_3001.p_28"),
+                "swing_lr_code": get("e_3001.p_05"),
+                "swing_ud_code": get("e_3001.p_06"),
+                "target_temperature_c": unit.target_temp_c,
+                "room_temperature_c": unit.room_temp_c,
+                "room_humidity_percent": unit.room_humidity_percent,
+                "sensor_temp_1_c": unit.sensor_temp_1_c,
+                "sensor_temp_2_c": unit.sensor_temp_2_c,
+            }
 
         self._units = units
         return units
@@ -468,31 +631,7 @@ class DaikinApiClient:
         patch = [{"pn": "p_01", "pv": mode_code}]
         overrides = mode_param_overrides or {}
 
-        if mode_code == MODE_CODE_COOL:
-            keys = {
-                "p_02": "32",
-                "p_05": "0F0000",
-                "p_06": "0F0000",
-                "p_09": "0700",
-                "p_0C": "00",
-            }
-        elif mode_code == MODE_CODE_DRY:
-            keys = {
-                "p_22": "020000",
-                "p_23": "0F0000",
-                "p_27": "0A00",
-                "p_31": "00",
-            }
-        elif mode_code == MODE_CODE_FAN:
-            # Fan-only appears to require its own e_3001 parameter group.
-            keys = {
-                "p_24": "020000",
-                "p_25": "050000",
-                "p_28": "0A00",
-            }
-        else:
-            keys = {}
-
+        keys = _MODE_TEMPLATES.get(mode_code, _EMPTY_MODE_TEMPLATE)
         for key, default in keys.items():
             value = overrides.get(key) or raw.get(f"e_3001.{key}") or default
             # Captured writes use fixed-width payload fragments.
@@ -521,7 +660,7 @@ class DaikinApiClient:
             raise DaikinApiError(f"Unknown edge_id: {edge_id}")
         current = self._units[edge_id]
         target_mode = mode_code or current.mode_code or MODE_CODE_COOL
-        fan_code = current.raw_status.get("e_3003.p_2D", "02")
+        fan_code = current.raw_status.get(_K_FAN, "02")
 
         mode_patch = self._build_mode_patch(
             current, target_mode, mode_param_overrides=mode_param_overrides
@@ -557,11 +696,12 @@ class DaikinApiClient:
         }
 
         await self._ensure_auth()
+        tokens = (self._access_token, self._id_token)
         status, data, text = await self._request(
             "PUT", MULTIREQ_PATH, json_body=body, auth=True
         )
         if status == 401:
-            await self.async_login()
+            await self._async_relogin(tokens)
             status, data, text = await self._request(
                 "PUT", MULTIREQ_PATH, json_body=body, auth=True
             )
@@ -16,9 +16,7 @@ from homeassistant.components.climate.const import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import DaikinApiError, DaikinUnit
 from .const import (
@@ -29,11 +27,11 @@ from .const import (
     MODE_CODE_COOL,
     MODE_CODE_DRY,
     MODE_CODE_FAN,
+    MODE_FAN_SPEED_PARAM_KEY,
     POWER_ON,
-    extract_fan_speed_code,
-    fan_speed_param_key_for_mode,
 )
 from .coordinator import DaikinCoordinator
+from .entity import DaikinEntity
 
 
 MODE_TO_CODE = {
@@ -42,6 +40,11 @@ MODE_TO_CODE = {
     HVACMode.FAN_ONLY: MODE_CODE_FAN,
 }
 CODE_TO_MODE = {v: k for k, v in MODE_TO_CODE.items()}
+# Running action per mode code; anything else is reported as cooling.
+_MODE_TO_ACTION: dict[str | None, HVACAction] = {
+    MODE_CODE_DRY: HVACAction.DRYING,
+    MODE_CODE_FAN: HVACAction.FAN,
+}
 
 SWING_TO_PARAMS = {
     SWING_BOTH: {"p_05": "0F0000", "p_06": "0F0000"},
@@ -49,6 +52,26 @@ SWING_TO_PARAMS = {
     SWING_VERTICAL: {"p_05": "0F0000", "p_06": "000000"},
     SWING_OFF: {"p_05": "000000", "p_06": "000000"},
 }
+SWING_PARAMS_TO_MODE: dict[tuple[str, str], str] = {
+    (p["p_05"], p["p_06"]): m for m, p in SWING_TO_PARAMS.items()
+}
+
+# Fan speed write overrides per (mode code, speed code). Unknown modes (None)
+# broadcast the speed to every mode-specific fan speed parameter.
+_FAN_WRITE_PARAMS: dict[tuple[str | None, str], dict[str, str]] = {
+    **{
+        (None, code): {key: code for key in ALL_FAN_SPEED_PARAM_KEYS}
+        for code in FAN_SPEED_NAME_TO_CODE.values()
+    },
+    **{
+        (mode, code): {param: code}
+        for mode, param in MODE_FAN_SPEED_PARAM_KEY.items()
+        for code in FAN_SPEED_NAME_TO_CODE.values()
+    },
+}
+
+# p_02 target temperature payloads, indexed by half-degree steps.
+_P02_HEX: tuple[str, ...] = tuple(f"{i:02X}" for i in range(0x100))
 
 
 async def async_setup_entry(
@@ -58,18 +81,16 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: DaikinCoordinator = data["coordinator"]
 
-    entities_by_edge: dict[str, DaikinClimateEntity] = {}
+    known_edges: set[str] = set()
 
     def _add_new_entities() -> None:
-        new_entities: list[DaikinClimateEntity] = []
-        for edge_id in coordinator.data:
-            if edge_id in entities_by_edge:
-                continue
-            ent = DaikinClimateEntity(coordinator, edge_id)
-            entities_by_edge[edge_id] = ent
-            new_entities.append(ent)
-        if new_entities:
-            async_add_entities(new_entities)
+        new_edges = coordinator.data.keys() - known_edges
+        if not new_edges:
+            return
+        known_edges.update(new_edges)
+        async_add_entities(
+            [DaikinClimateEntity(coordinator, edge_id) for edge_id in new_edges]
+        )
 
     _add_new_entities()
 
@@ -80,10 +101,9 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_handle_coordinator_update))
 
 
-class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
+class DaikinClimateEntity(DaikinEntity, ClimateEntity):
     """Daikin unit climate entity."""
 
-    _attr_has_entity_name = True
     _attr_hvac_modes = [HVACMode.COOL, HVACMode.DRY, HVACMode.FAN_ONLY]
     _attr_fan_modes = list(FAN_SPEED_NAME_TO_CODE)
     _attr_swing_modes = [SWING_BOTH, SWING_HORIZONTAL, SWING_VERTICAL, SWING_OFF]
@@ -100,35 +120,19 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
     _attr_target_temperature_step = 0.5
 
     def __init__(self, coordinator: DaikinCoordinator, edge_id: str) -> None:
-        super().__init__(coordinator)
-        self._edge_id = edge_id
+        super().__init__(coordinator, edge_id)
         self._attr_unique_id = f"daikin_{edge_id}"
         # Keep this on the instance as well; some HA paths read entity attrs
         # after initialization and before class attrs are resolved as expected.
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
 
-    @property
-    def _unit(self) -> DaikinUnit | None:
-        return self.coordinator.data.get(self._edge_id)
-
     @property
     def name(self) -> str | None:
         unit = self._unit
         return unit.name if unit else None
 
-    @property
-    def available(self) -> bool:
-        return self._unit is not None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        unit = self._unit
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._edge_id)},
-            manufacturer="Daikin",
-            model="Mobile Controller Cloud Unit",
-            name=unit.name if unit else f"Daikin {self._edge_id}",
-        )
+    def _state_key(self, unit: DaikinUnit) -> Any:
+        return (unit.name, unit.snapshot_attrs)
 
     @property
     def temperature_unit(self) -> str:
@@ -151,11 +155,7 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
             return None
         if unit.power_code != POWER_ON:
             return HVACAction.OFF
-        if unit.mode_code == MODE_CODE_DRY:
-            return HVACAction.DRYING
-        if unit.mode_code == MODE_CODE_FAN:
-            return HVACAction.FAN
-        return HVACAction.COOLING
+        return _MODE_TO_ACTION.get(unit.mode_code, HVACAction.COOLING)
 
     @property
     def target_temperature(self) -> float | None:
@@ -169,28 +169,16 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
         unit = self._unit
         if not unit:
             return None
-        return FAN_SPEED_CODE_TO_NAME.get(
-            extract_fan_speed_code(unit.raw_status, unit.mode_code)
-        )
+        return FAN_SPEED_CODE_TO_NAME.get(unit.fan_speed_code)
 
     @property
     def swing_mode(self) -> str | None:
         unit = self._unit
         if not unit:
             return None
-        p05_raw = unit.raw_status.get("e_3001.p_05", "")
-        p06_raw = unit.raw_status.get("e_3001.p_06", "")
-        p05 = p05_raw[:6]
-        p06 = p06_raw[:6]
-        if p05 == "0F0000" and p06 == "0F0000":
-            return SWING_BOTH
-        if p05 == "000000" and p06 == "0F0000":
-            return SWING_HORIZONTAL
-        if p05 == "0F0000" and p06 == "000000":
-            return SWING_VERTICAL
-        if p05 == "000000" and p06 == "000000":
-            return SWING_OFF
-        return None
+        p05 = unit.raw_status.get("e_3001.p_05", "")[:6]
+        p06 = unit.raw_status.get("e_3001.p_06", "")[:6]
+        return SWING_PARAMS_TO_MODE.get((p05, p06))
 
     @property
     def current_temperature(self) -> float | None:
@@ -211,26 +199,7 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
         unit = self._unit
         if not unit:
             return {}
-        attrs: dict[str, Any] = {
-            "edge_id": unit.edge_id,
-            "mac": unit.mac,
-            "power_code": unit.power_code,
-            "mode_code": unit.mode_code,
-            "fan_code": unit.fan_code,
-            "fan_speed_code": extract_fan_speed_code(unit.raw_status, unit.mode_code),
-            "fan_speed_param_key": fan_speed_param_key_for_mode(unit.mode_code),
-            "fan_speed_p09": unit.raw_status.get("e_3001.p_09"),
-            "fan_speed_p27": unit.raw_status.get("e_3001.p_27"),
-            "fan_speed_p28": unit.raw_status.get("e_3001.p_28"),
-            "swing_lr_code": unit.raw_status.get("e_3001.p_05"),
-            "swing_ud_code": unit.raw_status.get("e_3001.p_06"),
-            "target_temperature_c": unit.target_temp_c,
-            "room_temperature_c": unit.room_temp_c,
-            "room_humidity_percent": unit.room_humidity_percent,
-            "sensor_temp_1_c": unit.sensor_temp_1_c,
-            "sensor_temp_2_c": unit.sensor_temp_2_c,
-        }
-        return attrs
+        return unit.snapshot_attrs
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         unit = self._unit
@@ -242,9 +211,8 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
                     unit.edge_id, power_on=False
                 )
             else:
-                mode_code = MODE_TO_CODE.get(hvac_mode)
-                if not mode_code:
-                    return
+                # HA validates hvac_mode against _attr_hvac_modes before calling us.
+                mode_code = MODE_TO_CODE[hvac_mode]
                 await self.coordinator.client.async_write_state(
                     unit.edge_id, power_on=True, mode_code=mode_code
                 )
@@ -260,12 +228,9 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
         speed_code = FAN_SPEED_NAME_TO_CODE.get(fan_mode)
         if not speed_code:
             return
-        speed_param = fan_speed_param_key_for_mode(unit.mode_code)
-        params = (
-            {speed_param: speed_code}
-            if speed_param
-            else {key: speed_code for key in ALL_FAN_SPEED_PARAM_KEYS}
-        )
+        params = _FAN_WRITE_PARAMS.get((unit.mode_code, speed_code))
+        if params is None:
+            params = _FAN_WRITE_PARAMS[(None, speed_code)]
         try:
             await self.coordinator.client.async_write_state(
                 unit.edge_id,
@@ -290,9 +255,9 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
 
         # Daikin p_02 encodes target temp in 0.5C steps as hex.
         half_steps = int(round(temp_c * 2))
-        if half_steps < 0 or half_steps > 0xFF:
+        if half_steps < 0 or half_steps >= len(_P02_HEX):
             return
-        p02_hex = f"{half_steps:02X}"
+        p02_hex = _P02_HEX[half_steps]
 
         try:
             await self.coordinator.client.async_write_state(
@@ -308,9 +273,8 @@ class DaikinClimateEntity(CoordinatorEntity[DaikinCoordinator], ClimateEntity):
         unit = self._unit
         if not unit:
             return
-        params = SWING_TO_PARAMS.get(swing_mode)
-        if not params:
-            return
+        # HA validates swing_mode against _attr_swing_modes before calling us.
+        params = SWING_TO_PARAMS[swing_mode]
         try:
             await self.coordinator.client.async_write_state(
                 unit.edge_id,
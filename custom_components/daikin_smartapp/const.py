@@ -53,15 +53,24 @@ MODE_FAN_SPEED_PARAM_KEY: dict[str, str] = {
 }
 ALL_FAN_SPEED_PARAM_KEYS: tuple[str, ...] = ("p_09", "p_27", "p_28")
 
+# Raw status keys to probe for fan speed, with the mode's own key first.
+_DEFAULT_FAN_SPEED_STATUS_KEYS: tuple[str, ...] = tuple(
+    f"e_3001.{key}" for key in ALL_FAN_SPEED_PARAM_KEYS
+)
+_FAN_SPEED_STATUS_KEY_ORDER: dict[str | None, tuple[str, ...]] = {
+    mode: (f"e_3001.{preferred}",)
+    + tuple(f"e_3001.{key}" for key in ALL_FAN_SPEED_PARAM_KEYS if key != preferred)
+    for mode, preferred in MODE_FAN_SPEED_PARAM_KEY.items()
+}
+
 
 def normalize_hex_code(value: str | None, width: int = 4) -> str | None:
     """Return an uppercase fixed-width prefix from hex-like payload fragments."""
-    if not value:
-        return None
-    normalized = str(value).upper()
-    if len(normalized) < width:
+    if not value or len(value) < width:
         return None
-    return normalized[:width]
+    prefix = value[:width]
+    # Payload codes are usually already uppercase; avoid re-allocating them.
+    return prefix if prefix.isupper() or prefix.isdigit() else prefix.upper()
 
 
 def fan_speed_param_key_for_mode(mode_code: str | None) -> str | None:
@@ -75,13 +84,9 @@ def extract_fan_speed_code(
     raw_status: Mapping[str, str], mode_code: str | None
 ) -> str | None:
     """Extract mode-appropriate fan speed code from a unit raw status map."""
-    preferred_key = fan_speed_param_key_for_mode(mode_code)
-    keys = [preferred_key] if preferred_key else []
-    keys.extend(k for k in ALL_FAN_SPEED_PARAM_KEYS if k != preferred_key)
+    keys = _FAN_SPEED_STATUS_KEY_ORDER.get(mode_code, _DEFAULT_FAN_SPEED_STATUS_KEYS)
     for key in keys:
-        if not key:
-            continue
-        code = normalize_hex_code(raw_status.get(f"e_3001.{key}"))
+        code = normalize_hex_code(raw_status.get(key))
         if code in FAN_SPEED_CODE_TO_NAME:
             return code
     return None
@@ -0,0 +1,51 @@
+"""Base entity for Daikin SmartApp integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import DaikinUnit
+from .const import DOMAIN
+from .coordinator import DaikinCoordinator
+
+
+class DaikinEntity(CoordinatorEntity[DaikinCoordinator]):
+    """Coordinator entity backed by a single Daikin unit."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: DaikinCoordinator, edge_id: str) -> None:
+        super().__init__(coordinator)
+        self._edge_id = edge_id
+        # Resolved once per coordinator update instead of on every property read.
+        self._unit: DaikinUnit | None = coordinator.data.get(edge_id)
+        self._last_state: tuple[Any, ...] | None = None
+        # HA only reads device info when registering the entity.
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, edge_id)},
+            manufacturer="Daikin",
+            model="Mobile Controller Cloud Unit",
+            name=self._unit.name if self._unit else f"Daikin {edge_id}",
+        )
+
+    @property
+    def available(self) -> bool:
+        return self._unit is not None
+
+    def _state_key(self, unit: DaikinUnit) -> Any:
+        """Return the part of the unit this entity exposes."""
+        raise NotImplementedError
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        unit = self._unit = self.coordinator.data.get(self._edge_id)
+        # Skip state writes when nothing this entity exposes has changed.
+        state = (True, self._state_key(unit)) if unit else (False,)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        super()._handle_coordinator_update()
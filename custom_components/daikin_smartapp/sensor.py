@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Callable
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import DaikinUnit
-from .const import DOMAIN, FAN_SPEED_CODE_TO_NAME, FAN_SPEED_NAME_TO_CODE, extract_fan_speed_code
+from .const import DOMAIN, FAN_SPEED_CODE_TO_NAME, FAN_SPEED_NAME_TO_CODE
 from .coordinator import DaikinCoordinator
+from .entity import DaikinEntity
 
 
 @dataclass(frozen=True)
@@ -40,7 +40,7 @@ SENSOR_DEFS: tuple[SensorDef, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         options=None,
         entity_category=None,
-        value_fn=lambda u: u.room_temp_c,
+        value_fn=attrgetter("room_temp_c"),
     ),
     SensorDef(
         key="room_humidity",
@@ -50,7 +50,7 @@ SENSOR_DEFS: tuple[SensorDef, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         options=None,
         entity_category=None,
-        value_fn=lambda u: u.room_humidity_percent,
+        value_fn=attrgetter("room_humidity_percent"),
     ),
     SensorDef(
         key="target_temperature",
@@ -60,7 +60,7 @@ SENSOR_DEFS: tuple[SensorDef, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         options=None,
         entity_category=None,
-        value_fn=lambda u: u.target_temp_c,
+        value_fn=attrgetter("target_temp_c"),
     ),
     SensorDef(
         key="fan_speed",
@@ -70,9 +70,7 @@ SENSOR_DEFS: tuple[SensorDef, ...] = (
         state_class=None,
         options=tuple(FAN_SPEED_NAME_TO_CODE),
         entity_category=None,
-        value_fn=lambda u: FAN_SPEED_CODE_TO_NAME.get(
-            extract_fan_speed_code(u.raw_status, u.mode_code)
-        ),
+        value_fn=lambda u: FAN_SPEED_CODE_TO_NAME.get(u.fan_speed_code),
     ),
     SensorDef(
         key="diag_power_code",
@@ -82,7 +80,7 @@ SENSOR_DEFS: tuple[SensorDef, ...] = (
         state_class=None,
         options=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda u: u.power_code,
+        value_fn=attrgetter("power_code"),
     ),
     SensorDef(
         key="diag_mode_code",
@@ -92,7 +90,7 @@ SENSOR_DEFS: tuple[SensorDef, ...] = (
         state_class=None,
         options=None,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda u: u.mode_code,
+        value_fn=attrgetter("mode_code"),
     ),
     SensorDef(
         key="diag_e3003_p02",
@@ -134,20 +132,20 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: DaikinCoordinator = data["coordinator"]
 
-    entities_by_key: dict[tuple[str, str], DaikinUnitSensor] = {}
+    known_edges: set[str] = set()
 
     def _add_new_entities() -> None:
-        new_entities: list[DaikinUnitSensor] = []
-        for edge_id in coordinator.data:
-            for sensor_def in SENSOR_DEFS:
-                entity_key = (edge_id, sensor_def.key)
-                if entity_key in entities_by_key:
-                    continue
-                ent = DaikinUnitSensor(coordinator, edge_id, sensor_def)
-                entities_by_key[entity_key] = ent
-                new_entities.append(ent)
-        if new_entities:
-            async_add_entities(new_entities)
+        new_edges = coordinator.data.keys() - known_edges
+        if not new_edges:
+            return
+        known_edges.update(new_edges)
+        async_add_entities(
+            [
+                DaikinUnitSensor(coordinator, edge_id, sensor_def)
+                for edge_id in new_edges
+                for sensor_def in SENSOR_DEFS
+            ]
+        )
 
     _add_new_entities()
 
@@ -158,14 +156,11 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_handle_coordinator_update))
 
 
-class DaikinUnitSensor(CoordinatorEntity[DaikinCoordinator], SensorEntity):
+class DaikinUnitSensor(DaikinEntity, SensorEntity):
     """Expose per-unit telemetry as Home Assistant sensors."""
 
-    _attr_has_entity_name = True
-
     def __init__(self, coordinator: DaikinCoordinator, edge_id: str, sensor_def: SensorDef) -> None:
-        super().__init__(coordinator)
-        self._edge_id = edge_id
+        super().__init__(coordinator, edge_id)
         self._def = sensor_def
         self._attr_unique_id = f"daikin_{edge_id}_{sensor_def.key}"
         self._attr_name = sensor_def.name
@@ -175,23 +170,8 @@ class DaikinUnitSensor(CoordinatorEntity[DaikinCoordinator], SensorEntity):
         self._attr_options = sensor_def.options
         self._attr_entity_category = sensor_def.entity_category
 
-    @property
-    def _unit(self) -> DaikinUnit | None:
-        return self.coordinator.data.get(self._edge_id)
-
-    @property
-    def available(self) -> bool:
-        return self._unit is not None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        unit = self._unit
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._edge_id)},
-            manufacturer="Daikin",
-            model="Mobile Controller Cloud Unit",
-            name=unit.name if unit else f"Daikin {self._edge_id}",
-        )
+    def _state_key(self, unit: DaikinUnit) -> float | int | str | None:
+        return self._def.value_fn(unit)
 
     @property
     def native_value(self) -> float | int | str | None: